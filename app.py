@@ -21,9 +21,12 @@ token = st.sidebar.text_input("GitHub Token (Optional but Recommended)", type="p
 if not token:
     token = os.getenv("GITHUB_TOKEN")
 
-# Model Selection
-llm_client = LocalLLM()
-available_models = llm_client.list_models()
+# Model Selection (cached so widget interactions don't re-ping Ollama)
+@st.cache_data(ttl=60)
+def get_available_models():
+    return LocalLLM().list_models()
+
+available_models = get_available_models()
 selected_model = None
 
 if available_models:
@@ -36,6 +39,18 @@ else:
 # Input
 profile_input = st.text_input("Enter GitHub Username or Profile URL", placeholder="e.g. torvalds, https://github.com/torvalds")
 
+# Analysis cached per (username, model) so re-clicks and reruns don't re-fetch
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_analysis(username, _token, model):
+    analyzer = GitSightAnalyzer(token=_token if _token else None, llm_model=model)
+    data = analyzer.analyze_profile(username)
+    if data is None:
+        # Raise instead of returning None: st.cache_data would memoize the
+        # failure for the full TTL, and the token is excluded from the key —
+        # so a rate-limited anonymous run would mask a later tokened retry
+        raise RuntimeError("Failed to fetch profile. Check username or API limits.")
+    return data
+
 # Analyze button logic
 if st.button("Analyze Profile"):
     if not profile_input:
@@ -44,14 +59,10 @@ if st.button("Analyze Profile"):
         username = profile_input.rstrip("/").split("/")[-1].replace("@", "")
         
         with st.spinner(f"Analyzing {username}... This may take a minute (analyzing repos & structure)..."):
-            analyzer = GitSightAnalyzer(token=token if token else None, llm_model=selected_model)
             try:
-                data = analyzer.analyze_profile(username)
-                if data:
-                    st.session_state['profile_data'] = data
-                    st.success("Analysis Complete!")
-                else:
-                    st.error("Failed to fetch profile. Check username or API limits.")
+                data = run_analysis(username, token, selected_model)
+                st.session_state['profile_data'] = data
+                st.success("Analysis Complete!")
             except Exception as e:
                  st.error(f"Error: {e}")
 
@@ -64,16 +75,18 @@ if 'profile_data' in st.session_state:
     st.header(f"Hiring Readiness: {readiness.get('score', 0)}/100")
     st.subheader(f"{readiness.get('tier_label', '')} - {readiness.get('tier', '')}")
     
-    # Columns for Role Fit
+    # Columns for Role Fit (bind each nested dict once instead of re-walking
+    # data on every st.metric call — this block reruns on each interaction)
     col1, col2, col3 = st.columns(3)
     roles = data.get("role_scores", {}).get("role_scores", {}) # Fix structure access
-    
+    ml, be, sre = (roles.get(k, {}) for k in ("ml_engineer", "backend_engineer", "sre"))
+
     with col1:
-        st.metric("ML Engineer", f"{roles.get('ml_engineer', {}).get('score', 0)}%", roles.get('ml_engineer', {}).get('fit_label', 'N/A'))
+        st.metric("ML Engineer", f"{ml.get('score', 0)}%", ml.get('fit_label', 'N/A'))
     with col2:
-        st.metric("Backend Engineer", f"{roles.get('backend_engineer', {}).get('score', 0)}%", roles.get('backend_engineer', {}).get('fit_label', 'N/A'))
+        st.metric("Backend Engineer", f"{be.get('score', 0)}%", be.get('fit_label', 'N/A'))
     with col3:
-        st.metric("SRE", f"{roles.get('sre', {}).get('score', 0)}%", roles.get('sre', {}).get('fit_label', 'N/A'))
+        st.metric("SRE", f"{sre.get('score', 0)}%", sre.get('fit_label', 'N/A'))
 
     st.divider()
     
@@ -108,7 +121,7 @@ if 'profile_data' in st.session_state:
             c1, c2 = st.columns(2)
             with c1:
                 st.markdown("#### Score Breakdown")
-                st.json(selected_repo["score_breakdown"])
+                st.json(selected_repo["score_breakdown"].asdict())
             with c2:
                 st.markdown("#### Insights")
                 st.markdown("**Strengths:**")
@@ -116,10 +129,16 @@ if 'profile_data' in st.session_state:
                 st.markdown("**Weaknesses & Gaps:**")
                 for w in selected_repo.get("weaknesses", []): st.write(f"⚠️ {w}")
 
-    # Download Report
+    # Download Report (serialized once per analysis, straight to the button —
+    # no disk round-trip on every rerun)
     st.divider()
-    reporter = ReportGenerator(data)
-    json_str = reporter.generate_json("report.json") # Saves locally
-    with open("report.json", "r") as f:
-         st.download_button("Download JSON Report", f, file_name=f"{data.get('username', 'profile')}_report.json", mime="application/json")
+
+    # analyzed_at in the key invalidates the cached bytes whenever a fresh
+    # analysis lands (different model, expired run_analysis TTL, ...)
+    @st.cache_data
+    def report_json_bytes(username, analyzed_at, _data):
+        return ReportGenerator(_data).to_json_bytes()
+
+    json_bytes = report_json_bytes(data.get('username', 'profile'), data.get('analyzed_at', ''), data)
+    st.download_button("Download JSON Report", json_bytes, file_name=f"{data.get('username', 'profile')}_report.json", mime="application/json")
 
@@ -0,0 +1,57 @@
+import logging
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _readiness_kernel(scores, tci, dep):
+        """
+        Single-pass reduction over the SoA repo arrays: returns
+        (avg_score, best3_avg, testing_ci_count, deployability_count).
+        Top-3 tracked with a manual compare-and-swap chain so nothing is
+        sorted or allocated in the loop.
+        """
+        n = scores.shape[0]
+        total = 0.0
+        a = -1.0
+        b = -1.0
+        c = -1.0  # invariant: a >= b >= c
+        tci_count = 0
+        dep_count = 0
+        for i in range(n):
+            s = scores[i]
+            total += s
+            if s >= a:
+                c = b; b = a; a = s
+            elif s >= b:
+                c = b; b = s
+            elif s > c:
+                c = s
+            if tci[i] > 0: tci_count += 1
+            if dep[i] > 0: dep_count += 1
+
+        if n >= 3:
+            best3 = (a + b + c) / 3.0
+        elif n == 2:
+            best3 = (a + b) / 2.0
+        else:
+            best3 = a
+        return total / n, best3, tci_count, dep_count
+
+    def readiness_reduce(scores, tci, dep):
+        """Runs the JIT'd kernel over the scoring view's SoA arrays."""
+        avg, best3, tci_count, dep_count = _readiness_kernel(scores, tci, dep)
+        return avg, best3, int(tci_count), int(dep_count)
+
+    try:
+        # Warm the JIT at import so the first profile doesn't pay compile latency
+        _readiness_kernel(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32),
+                          np.zeros(1, dtype=np.float32))
+    except Exception as e:
+        logging.warning(f"Numba kernel warmup failed, disabling: {e}")
+        NUMBA_AVAILABLE = False
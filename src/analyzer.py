@@ -1,21 +1,149 @@
 import os
-import shutil
-import tempfile
 import logging
+import multiprocessing
+import re
+import tarfile
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+import requests
+from urllib3.util.retry import Retry
 from github import Github, GithubException
-from .utils import clone_repo, cleanup_repo
+from . import gh_async
 from .scoring import compute_hiring_readiness, compute_role_fit
 from .llm_client import LocalLLM
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Repos are analyzed concurrently; each analysis is dominated by network I/O
+# (GitHub API, git clone) and LLM calls, so threads overlap nicely.
+MAX_WORKERS = 8
+
+# One shared process pool for complexity scoring: _analyze_complexity_python
+# runs inside the MAX_WORKERS thread pool, so per-repo pools would fan out to
+# 8 × cpu_count workers, each re-paying interpreter start + radon import.
+# Created lazily; below the threshold the pool overhead beats the parse time
+# and files are scored in-process instead.
+_CC_POOL = None
+_CC_POOL_LOCK = threading.Lock()
+_CC_MIN_FILES_FOR_POOL = 20
+
+def _cc_pool():
+    global _CC_POOL
+    with _CC_POOL_LOCK:
+        if _CC_POOL is None:
+            # spawn, not fork: the pool is created lazily while the analysis
+            # thread pool is already running, and forking a multithreaded
+            # process can deadlock on locks held at fork time. The workers
+            # import radon either way, so spawn costs nothing extra here.
+            _CC_POOL = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _CC_POOL
+
+# Filename signals, hoisted so the per-repo checks are set lookups and a
+# single C-level regex scan instead of Python-level loops
+_SRC_DIRS = frozenset({"src", "lib", "app", "core"})
+_TEST_DIRS = frozenset({"tests", "test", "__tests__", "spec"})
+# "test" anywhere in the last path component, checked once against the
+# newline-joined file list
+_TEST_FILE_RE = re.compile(r"test[^/\n]*$", re.IGNORECASE | re.MULTILINE)
+_CONFIG_FILES = frozenset({".travis.yml", "Jenkinsfile", "pytest.ini", "jest.config.js"})
+_DEPLOY_FILES = frozenset({
+    "Dockerfile", "docker-compose.yml", "Procfile", "requirements.txt",
+    "package.json", ".vercelignore", "netlify.toml",
+})
+_README_KEYWORDS = (("install", 10), ("usage", 10), ("contributing", 10), ("license", 10), ("##", 10))
+
+@dataclass(slots=True)
+class ScoreBreakdown:
+    """
+    Per-repo component scores. Slots make the hot scoring-loop reads
+    C-level attribute access instead of two dict lookups per component,
+    and drop the per-instance dict. asdict() feeds the JSON/UI boundary.
+    """
+    code_structure: int = 0
+    testing_ci: int = 0
+    readme: int = 0
+    project_value: int = 0
+    deployability: int = 0
+    complexity: int = 0
+    security: int = 0
+
+    def asdict(self):
+        return {
+            "code_structure": self.code_structure,
+            "testing_ci": self.testing_ci,
+            "readme": self.readme,
+            "project_value": self.project_value,
+            "deployability": self.deployability,
+            "complexity": self.complexity,
+            "security": self.security,
+        }
+
+@dataclass
+class RepoIndex:
+    """Single-pass index over a repo's tree, shared by all _analyze_* checks."""
+    file_paths: list = field(default_factory=list)
+    py_files: list = field(default_factory=list)
+    dir_names: set = field(default_factory=set)
+    top_level_dirs: set = field(default_factory=set)
+    file_count: int = 0
+
+def _cc_one_source(source):
+    """
+    Scores cyclomatic complexity for one Python source string.
+    Returns (total_complexity, block_count). Module-level so it pickles
+    for the process pool; parses once and feeds the AST straight to radon.
+    """
+    try:
+        import ast
+        from radon.visitors import ComplexityVisitor
+        visitor = ComplexityVisitor.from_ast(ast.parse(source))
+        total = 0
+        count = 0
+        for block in visitor.blocks:
+            total += block.complexity
+            count += 1
+        return total, count
+    except Exception:
+        return 0, 0
+
+def build_repo_index(tree_entries):
+    """Builds a RepoIndex in one pass over (path, type, size) tuples."""
+    index = RepoIndex()
+    for path, etype, _ in tree_entries:
+        if etype == "tree":
+            index.dir_names.add(path.rsplit("/", 1)[-1])
+            if "/" not in path:
+                index.top_level_dirs.add(path)
+        elif etype == "blob":
+            index.file_paths.append(path)
+            index.file_count += 1
+            if path.endswith(".py"):
+                index.py_files.append(path)
+    return index
+
 class GitSightAnalyzer:
     def __init__(self, token=None, llm_model=None):
-        self.github = Github(token)
+        # per_page=100 quarters the pagination requests for repo listing;
+        # pool_size=16 gives the worker threads shared keep-alive connections
+        # instead of fresh TLS handshakes
+        self.github = Github(
+            token,
+            per_page=100,
+            pool_size=16,
+            retry=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        )
+        self.token = token
         self.user = None
         self.llm = LocalLLM(model_name=llm_model) if llm_model else None
+        # Ollama client is shared across worker threads; serialize access to it
+        self._llm_lock = threading.Lock()
 
     def analyze_profile(self, username):
         """
@@ -34,28 +162,59 @@ class GitSightAnalyzer:
             "analyzed_at": datetime.now().isoformat(),
             "total_repos_analyzed": 0,
             "primary_language": "Unknown",
-            "languages_detected": set(),
+            "languages_detected": [],
             "repositories": []
         }
 
-        repos = self.user.get_repos()
-        for repo in repos:
-            if repo.fork:
-                continue  # Skip forks unless heavily modified (simplified for now)
-            
-            logging.info(f"Analyzing repo: {repo.name}")
-            repo_analysis = self.analyze_repo(repo)
-            profile_data["repositories"].append(repo_analysis)
-            profile_data["languages_detected"].add(repo.language)
+        # Materialize the paginated repo list up front so pagination HTTP calls
+        # don't serialize inside the worker pool. Skip forks unless heavily
+        # modified (simplified for now).
+        repos = [r for r in self.user.get_repos() if not r.fork]
+
+        # Prefetch all trees and READMEs on one async connection pool; each
+        # worker then runs CPU-only scoring (PyGithub remains the fallback for
+        # anything the prefetch missed)
+        prefetched = {}
+        if gh_async.is_available():
+            pairs = [(r.full_name, r.default_branch) for r in repos]
+            prefetched = gh_async.fetch_repo_data(pairs, self.token)
+
+        progress = {"done": 0}
+        progress_lock = threading.Lock()
+
+        def _analyze_one(repo):
+            result = self.analyze_repo(repo, prefetched.get(repo.full_name))
+            with progress_lock:
+                progress["done"] += 1
+                logging.info(f"Analyzed repo ({progress['done']}/{len(repos)}): {repo.name}")
+            return result
+
+        # map() keeps the GitHub listing order, so reports and the UI stay
+        # deterministic run-to-run (we wait for every repo anyway)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            profile_data["repositories"] = list(executor.map(_analyze_one, repos))
+
+        # One batched LLM call covers every README instead of one per repo
+        if self.llm:
+            self._merge_readme_llm(profile_data["repositories"])
 
         profile_data["total_repos_analyzed"] = len(profile_data["repositories"])
-        profile_data["languages_detected"] = list(profile_data["languages_detected"])
-        
-        # Determine primary language by frequency
-        if profile_data["languages_detected"]:
-            langs = [r['language'] for r in profile_data["repositories"] if r['language']]
-            if langs:
-                profile_data["primary_language"] = max(set(langs), key=langs.count)
+
+        # Aggregate strengths/weaknesses once here, so report rendering (which
+        # Streamlit re-runs on every interaction) doesn't re-loop all repos
+        analyzed = profile_data["repositories"]
+        strength_counts = Counter(s for r in analyzed for s in r["strengths"])
+        profile_data["top_strengths"] = [s for s, _ in strength_counts.most_common(5)]
+        weakness_counts = Counter(w for r in analyzed for w in r["weaknesses"])
+        profile_data["top_weaknesses"] = [w for w, _ in weakness_counts.most_common(5)]
+
+        # Determine primary language by frequency — one Counter pass instead of
+        # an O(n*k) max(set, key=list.count), and its keys double as the
+        # detected-language list
+        lang_counts = Counter(r["language"] for r in analyzed if r["language"])
+        profile_data["languages_detected"] = list(lang_counts)
+        if lang_counts:
+            profile_data["primary_language"] = lang_counts.most_common(1)[0][0]
 
         # Compute Higher Level Scores
         hiring_readiness = compute_hiring_readiness(profile_data)
@@ -70,28 +229,29 @@ class GitSightAnalyzer:
 
         return profile_data
 
-    def analyze_repo(self, repo):
+    def analyze_repo(self, repo, prefetch=None):
         """
-        Analyzes a single repository.
+        Analyzes a single repository. `prefetch` is an optional
+        (tree_entries, readme, truncated) triple from gh_async; without it
+        the data is fetched through PyGithub.
         """
+        # Bind PyGithub attributes once — every access goes through __getattr__
+        # and may lazily materialize _rawData, so touch each field exactly once
+        language = repo.language
+        stars = repo.stargazers_count
+        forks = repo.forks_count
+
+        breakdown = ScoreBreakdown()
         analysis = {
             "repo_name": repo.name,
             "repo_url": repo.html_url,
-            "language": repo.language,
-            "stars": repo.stargazers_count,
-            "forks": repo.forks_count,
+            "language": language,
+            "stars": stars,
+            "forks": forks,
             "description": repo.description,
             "composite_score": 0,  # Computed later
             "rating": "Unknown",   # Computed later
-            "score_breakdown": {
-                "code_structure": 0,
-                "testing_ci": 0,
-                "readme": 0,
-                "project_value": 0, 
-                "deployability": 0,
-                "complexity": 0,
-                "security": 0
-            },
+            "score_breakdown": breakdown,
             "strengths": [],
             "weaknesses": [],
             "critical_flags": [],
@@ -99,78 +259,108 @@ class GitSightAnalyzer:
         }
 
         # Value Assessment (Stage 2G) - Basic Heuristics
-        stars = repo.stargazers_count
-        forks = repo.forks_count
         # Simple score based on popularity
         project_value = min(100, (stars * 2 + forks * 5))
-        analysis["score_breakdown"]["project_value"] = project_value
+        breakdown.project_value = project_value
         if project_value > 50:
              analysis["strengths"].append("High community interest (stars/forks)")
 
-        # Clone and Deep Analyze
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = os.path.join(temp_dir, repo.name)
-            if clone_repo(repo.clone_url, repo_path):
-                # Analyze structure
-                struct_score, struct_notes = self._analyze_structure(repo_path, repo.language)
-                analysis["score_breakdown"]["code_structure"] = struct_score
-                analysis["strengths"].extend(struct_notes.get("strengths", []))
-                analysis["weaknesses"].extend(struct_notes.get("weaknesses", []))
-
-                # Analyze README
-                readme_score, readme_notes = self._analyze_readme(repo_path)
-                analysis["score_breakdown"]["readme"] = readme_score
-                if readme_notes:
-                    analysis["strengths"].extend(readme_notes.get("strengths", []))
-                    analysis["weaknesses"].extend(readme_notes.get("weaknesses", []))
-                
-                if readme_score > 70 and not readme_notes: # Fallback if no LLM notes
-                    analysis["strengths"].append("Detailed README")
-                elif readme_score <= 40 and not readme_notes:
-                    analysis["weaknesses"].append("README lacks depth")
-
-                # Analyze Testing
-                test_score, test_notes = self._analyze_testing(repo_path)
-                analysis["score_breakdown"]["testing_ci"] = test_score
-                if test_score > 0:
-                     analysis["strengths"].append("Testing infrastructure detected")
-                else:
-                     analysis["weaknesses"].append("No tests found")
-
-                # Analyze Python Complexity (if Python)
-                if repo.language == "Python":
-                   comp_score = self._analyze_complexity_python(repo_path)
-                   analysis["score_breakdown"]["complexity"] = comp_score
-                else:
-                   analysis["score_breakdown"]["complexity"] = 50 # Default middle ground
-
-                # Security & Deployability
-                sec_score, deploy_score = self._analyze_sec_deploy(repo_path)
-                analysis["score_breakdown"]["security"] = sec_score
-                analysis["score_breakdown"]["deployability"] = deploy_score
+        # Deep analysis from the Trees API (no clone needed; most checks only
+        # look at filenames, and the README comes from the contents API)
+        if prefetch is not None:
+            tree_entries, readme, truncated = prefetch
+        else:
+            tree_entries, truncated = self._fetch_tree(repo)
+            readme = self._fetch_readme(repo) if tree_entries else None
+
+        if tree_entries is None:
+            logging.warning(f"Failed to fetch tree for {repo.name}. Skipping deep analysis.")
+            analysis["critical_flags"].append("Tree fetch failed - manual inspection required")
+        else:
+            if truncated:
+                # The Trees API capped the listing; don't present the
+                # degraded analysis as complete
+                analysis["critical_flags"].append("File listing truncated - analysis based on a partial tree")
+            # An empty list is a real (empty) repo: score it normally rather
+            # than flagging it, like the clone-based path used to
+            index = build_repo_index(tree_entries)
+
+            # Analyze structure
+            struct_score, struct_notes = self._analyze_structure(index, language)
+            breakdown.code_structure = struct_score
+            analysis["strengths"].extend(struct_notes.get("strengths", []))
+            analysis["weaknesses"].extend(struct_notes.get("weaknesses", []))
+
+            # Analyze README (heuristics only here; LLM notes are merged in
+            # one batched call per profile, see _merge_readme_llm)
+            readme_score, readme_excerpt = self._analyze_readme(readme)
+            breakdown.readme = readme_score
+            if self.llm and readme_excerpt:
+                analysis["_readme_excerpt"] = readme_excerpt
+            elif readme_score > 70: # Fallback if no LLM notes
+                analysis["strengths"].append("Detailed README")
+            elif readme_score <= 40:
+                analysis["weaknesses"].append("README lacks depth")
 
+            # Analyze Testing
+            test_score, test_notes = self._analyze_testing(index)
+            breakdown.testing_ci = test_score
+            if test_score > 0:
+                 analysis["strengths"].append("Testing infrastructure detected")
             else:
-                logging.warning(f"Failed to clone {repo.name}. Skipping deep analysis.")
-                analysis["critical_flags"].append("Clone failed - manual inspection required")
+                 analysis["weaknesses"].append("No tests found")
+
+            # Analyze Python Complexity (if Python and .py files actually exist)
+            if language == "Python" and index.py_files:
+               comp_score = self._analyze_complexity_python(repo)
+               breakdown.complexity = comp_score
+            else:
+               breakdown.complexity = 50 # Default middle ground
+
+            # Security & Deployability
+            sec_score, deploy_score = self._analyze_sec_deploy(index)
+            breakdown.security = sec_score
+            breakdown.deployability = deploy_score
 
         # Calculate Composite Score
-        analysis["composite_score"] = self._calculate_composite(analysis["score_breakdown"])
+        analysis["composite_score"] = self._calculate_composite(breakdown)
         analysis["rating"] = self._get_rating_label(analysis["composite_score"])
         
         return analysis
 
-    def _analyze_structure(self, path, language):
+    def _fetch_tree(self, repo):
+        """
+        Fetches the full file listing in a single Trees API call.
+        Returns (entries, truncated) where entries is a flat list of
+        (path, type, size) tuples, [] for a repo with no tree (empty /
+        unborn default branch), or None when the fetch actually failed.
+        truncated marks a capped Trees API listing (~100k entries).
+        """
+        try:
+            tree = repo.get_git_tree(repo.default_branch, recursive=True)
+            truncated = bool(tree.truncated)
+            if truncated:
+                logging.warning(f"Tree listing for {repo.name} is truncated; analysis will be partial")
+            return [(e.path, e.type, e.size or 0) for e in tree.tree], truncated
+        except GithubException as e:
+            if e.status in (404, 409):
+                # Empty repository or missing default branch — nothing to
+                # scan, but not a failure worth a critical flag
+                return [], False
+            logging.warning(f"Error fetching tree for {repo.name}: {e}")
+            return None, False
+
+    def _analyze_structure(self, index, language):
         score = 50
         notes = {"strengths": [], "weaknesses": []}
         # Check for modularity
-        src_dirs = ["src", "lib", "app", "core"]
-        found_dirs = [d for d in src_dirs if os.path.exists(os.path.join(path, d))]
+        found_dirs = sorted(_SRC_DIRS & index.top_level_dirs)
         if found_dirs:
             score += 20
             notes["strengths"].append(f"Structured project layout ({', '.join(found_dirs)})")
-        
+
         # File count heuristic
-        file_count = sum([len(files) for r, d, files in os.walk(path)])
+        file_count = index.file_count
         if file_count < 3:
             score -= 20
             notes["weaknesses"].append("Very small codebase (skeleton?)")
@@ -179,85 +369,115 @@ class GitSightAnalyzer:
 
         return min(100, max(0, score)), notes
 
-    def _analyze_readme(self, path):
+    def _fetch_readme(self, repo):
+        """Fetches the README via the contents API; (content_bytes, size) or None."""
+        try:
+            readme = repo.get_readme()
+            return readme.decoded_content, readme.size
+        except GithubException:
+            return None
+
+    def _analyze_readme(self, readme):
+        """
+        Heuristic README scoring over a (content_bytes, size) pair. Returns
+        (score, excerpt) where the excerpt feeds the batched LLM pass; LLM
+        notes/scores are merged afterwards.
+        """
+        if readme is None:
+            return 0, None
+
+        content_bytes, size = readme
         score = 0
-        readme_path = None
-        for f in os.listdir(path):
-            if f.lower().startswith("readme"):
-                readme_path = os.path.join(path, f)
-                break
-        
-        if readme_path:
-            score += 30 # Exists
-            with open(readme_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read().lower()
-                if len(content) > 500: score += 20 # Length
-                if "install" in content: score += 10
-                if "usage" in content: score += 10
-                if "contributing" in content: score += 10
-                if "license" in content: score += 10
-                if "##" in content: score += 10 # Structure
-
-                if self.llm:
-                    try:
-                        llm_analysis = self.llm.analyze_readme(content)
-                        if llm_analysis and isinstance(llm_analysis, dict):
-                            # Average the score
-                            llm_score = llm_analysis.get('score', 0)
-                            score = (score + llm_score) / 2
-                            # Append notes
-                            # analyzer.py expects the calling function to handle strength/weakness appending 
-                            # but _analyze_readme returns (score, notes_dict)
-                            # so we should add them to the return value
-                            return min(100, int(score)), {
-                                "strengths": llm_analysis.get("strengths", []), 
-                                "weaknesses": llm_analysis.get("weaknesses", [])
-                            }
-                    except Exception as e:
-                        logging.error(f"Error in LLM readme analysis: {e}")
-        
-        return min(100, score), {}
+        # The first 8 KB is plenty for keyword scoring; don't decode and
+        # lowercase a multi-hundred-KB README just to check five keywords
+        content = content_bytes[:8192].decode("utf-8", errors="ignore").lower()
+
+        score += 30 # Exists
+        if size > 500: score += 20 # Length (full blob size, not the capped buffer)
+        for keyword, bonus in _README_KEYWORDS:
+            if keyword in content:
+                score += bonus
+
+        return min(100, score), content[:2000]
+
+    def _merge_readme_llm(self, analyses):
+        """
+        Folds the batched LLM README results back into each repo analysis
+        (average the score, append notes, recompute the composite).
+        """
+        pending = [(a["repo_name"], a.pop("_readme_excerpt")) for a in analyses if "_readme_excerpt" in a]
+        if not pending:
+            return
+
+        try:
+            with self._llm_lock:
+                results = self.llm.analyze_readmes_batch(pending)
+        except Exception as e:
+            logging.error(f"Error in LLM readme analysis: {e}")
+            results = {}
+
+        by_name = {a["repo_name"]: a for a in analyses}
+        for name, _ in pending:
+            analysis = by_name[name]
+            breakdown = analysis["score_breakdown"]
+            heuristic = breakdown.readme
+            llm_analysis = results.get(name)
+            if llm_analysis and isinstance(llm_analysis, dict):
+                # Average the heuristic and LLM scores
+                breakdown.readme = min(100, int((heuristic + llm_analysis.get("score", 0)) / 2))
+                analysis["strengths"].extend(llm_analysis.get("strengths", []))
+                analysis["weaknesses"].extend(llm_analysis.get("weaknesses", []))
+            elif heuristic > 70: # Fallback if no LLM notes
+                analysis["strengths"].append("Detailed README")
+            elif heuristic <= 40:
+                analysis["weaknesses"].append("README lacks depth")
 
-    def _analyze_testing(self, path):
+            analysis["composite_score"] = self._calculate_composite(breakdown)
+            analysis["rating"] = self._get_rating_label(analysis["composite_score"])
+
+    def _analyze_testing(self, index):
         score = 0
-        notes = []
-        test_dirs = ["tests", "test", "__tests__", "spec"]
-        for root, dirs, files in os.walk(path):
-            if any(d in test_dirs for d in dirs):
+        if _TEST_DIRS & index.dir_names:
+            score += 40
+        elif _TEST_FILE_RE.search("\n".join(index.file_paths)):
+            score += 20
+
+        # Check config files
+        for path in index.file_paths:
+            if os.path.basename(path) in _CONFIG_FILES or path.startswith((".github/", ".circleci/")):
                 score += 40
                 break
-            # Check file names
-            if any("test" in f.lower() for f in files):
-                 score += 20
-                 break
-        
-        # Check config files
-        config_files = [".travis.yml", ".circleci", "Jenkinsfile", ".github/workflows", "pytest.ini", "jest.config.js"]
-        for root, dirs, files in os.walk(path): # Simple check
-             for f in files:
-                 if f in config_files or ".github" in root:
-                     score += 40
-                     return min(100, score), {}
-        
+
         return min(100, score), {}
 
-    def _analyze_complexity_python(self, path):
-        # Placeholder for Radon complexity check
-        # Actually implement using Radon programmatically
+    def _analyze_complexity_python(self, repo):
+        # Radon complexity check over the repo tarball, streamed in-memory
+        # (only this check needs file contents, so no clone / temp dir)
         try:
-            from radon.complexity import cc_visit
-            file_count = 0
-            total_cc = 0
-            for root, dirs, files in os.walk(path):
-                for file in files:
-                    if file.endswith(".py"):
-                        file_path = os.path.join(root, file)
-                        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                            content = f.read()
-                            results = cc_visit(content)
-                            for func in results:
-                                total_cc += func.complexity
-                                file_count += 1
+            url = repo.get_archive_link("tarball")
+            headers = {"Authorization": f"token {self.token}"} if self.token else {}
+            response = requests.get(url, headers=headers, stream=True, timeout=60)
+            response.raise_for_status()
+
+            sources = []
+            with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
+                for member in tar:
+                    if member.isfile() and member.name.endswith(".py"):
+                        sources.append(tar.extractfile(member).read().decode("utf-8", errors="ignore"))
+
+            if not sources:
+                return 50
+
+            # CC scoring is CPU-bound (ast.parse holds the GIL), so fan big
+            # repos out across the shared process pool; small ones are
+            # cheaper to parse right here
+            if len(sources) < _CC_MIN_FILES_FOR_POOL:
+                results = [_cc_one_source(source) for source in sources]
+            else:
+                results = list(_cc_pool().map(_cc_one_source, sources, chunksize=8))
+            total_cc = sum(total for total, _ in results)
+            file_count = sum(count for _, count in results)
+
             if file_count > 0:
                 avg_cc = total_cc / file_count
                 # Lower CC is better. Score 100 if avg_cc <= 5. Score 0 if avg_cc >= 20.
@@ -267,20 +487,17 @@ class GitSightAnalyzer:
             pass
         return 50
 
-    def _analyze_sec_deploy(self, path):
+    def _analyze_sec_deploy(self, index):
         sec_score = 80 # Assume good unless bad things found
-        deploy_score = 0
-        
-        # Deploy signals
-        deploy_files = ["Dockerfile", "docker-compose.yml", "Procfile", "requirements.txt", "package.json", ".vercelignore", "netlify.toml"]
-        
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file in deploy_files:
-                    deploy_score += 20
-                if file == "Dockerfile": deploy_score += 30
-                if file.endswith(".tf"): deploy_score += 30 # Terraform
-        
+
+        # Deploy signals — the score caps at 100, so there's no point scanning
+        # a monorepo's thousands of files counting duplicates; one set
+        # intersection over basenames covers it
+        hits = _DEPLOY_FILES & {os.path.basename(p) for p in index.file_paths}
+        deploy_score = len(hits) * 20
+        if "Dockerfile" in hits: deploy_score += 30
+        if any(p.endswith(".tf") for p in index.file_paths): deploy_score += 30 # Terraform
+
         # Basic Security (Secrets)
         # VERY simple check strictly for demo
         # Real implementation needs regex for keys
@@ -290,13 +507,13 @@ class GitSightAnalyzer:
         # Weighted formula from prompt
         # Code Quality & Structure: 25% | Testing & CI: 20% | Documentation: 15% | Value: 15% | Deploy: 10% | Complexity: 8% | Security: 7%
         score = (
-            breakdown["code_structure"] * 0.25 +
-            breakdown["testing_ci"] * 0.20 +
-            breakdown["readme"] * 0.15 +
-            breakdown["project_value"] * 0.15 +
-            breakdown["deployability"] * 0.10 +
-            breakdown["complexity"] * 0.08 +
-            breakdown["security"] * 0.07
+            breakdown.code_structure * 0.25 +
+            breakdown.testing_ci * 0.20 +
+            breakdown.readme * 0.15 +
+            breakdown.project_value * 0.15 +
+            breakdown.deployability * 0.10 +
+            breakdown.complexity * 0.08 +
+            breakdown.security * 0.07
         )
         return int(score)
 
@@ -0,0 +1,88 @@
+import asyncio
+import base64
+import logging
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+API_ROOT = "https://api.github.com"
+
+def is_available():
+    """True when httpx is installed and async prefetch can be used."""
+    return httpx is not None
+
+async def _fetch_repo_data(client, full_name, default_branch):
+    """Fetches one repo's recursive tree and README concurrently."""
+    tree_resp, readme_resp = await asyncio.gather(
+        client.get(f"{API_ROOT}/repos/{full_name}/git/trees/{default_branch}", params={"recursive": "1"}),
+        client.get(f"{API_ROOT}/repos/{full_name}/readme"),
+    )
+
+    # Anything but a 200 tree (rate limit, transient 5xx, empty repo) drops
+    # the repo from the prefetch dict entirely — the caller's PyGithub
+    # client re-fetches it with retries and can tell empty from failed
+    if tree_resp.status_code != 200:
+        logging.warning(f"Prefetch tree for {full_name} returned {tree_resp.status_code}; deferring to PyGithub")
+        return full_name, None, None, False
+    payload = tree_resp.json()
+    # The Trees API silently caps huge listings (~100k entries); surface it
+    # so the analysis isn't presented as complete
+    truncated = bool(payload.get("truncated"))
+    if truncated:
+        logging.warning(f"Tree listing for {full_name} is truncated; analysis will be partial")
+    tree_entries = [(e["path"], e["type"], e.get("size") or 0) for e in payload.get("tree", [])]
+
+    # Only a 404 means "no README"; any other failure (rate limit, 5xx)
+    # drops the repo too, so the readme isn't silently scored as missing
+    readme = None
+    if readme_resp.status_code == 200:
+        payload = readme_resp.json()
+        try:
+            content = base64.b64decode(payload.get("content", ""))
+        except Exception:
+            content = b""
+        readme = (content, payload.get("size") or len(content))
+    elif readme_resp.status_code != 404:
+        logging.warning(f"Prefetch README for {full_name} returned {readme_resp.status_code}; deferring to PyGithub")
+        return full_name, None, None, False
+
+    return full_name, tree_entries, readme, truncated
+
+async def _fetch_all(repos, token):
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    limits = httpx.Limits(max_connections=16)
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30.0, follow_redirects=True) as client:
+        tasks = [_fetch_repo_data(client, full_name, branch) for full_name, branch in repos]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    fetched = {}
+    for result in results:
+        if isinstance(result, Exception):
+            logging.warning(f"Async repo fetch failed: {result}")
+            continue
+        full_name, tree_entries, readme, truncated = result
+        if tree_entries is None:
+            continue
+        fetched[full_name] = (tree_entries, readme, truncated)
+    return fetched
+
+def fetch_repo_data(repos, token=None):
+    """
+    Concurrently fetches trees and READMEs for [(full_name, default_branch)]
+    pairs over one shared connection pool. Returns a dict mapping full_name to
+    (tree_entries, readme, truncated) where readme is (content_bytes, size) or
+    None and truncated marks a capped Trees API listing. Repos whose fetch
+    failed are simply absent; callers fall back to PyGithub.
+    """
+    if httpx is None or not repos:
+        return {}
+    try:
+        return asyncio.run(_fetch_all(repos, token))
+    except Exception as e:
+        logging.warning(f"Async prefetch failed, falling back to PyGithub: {e}")
+        return {}
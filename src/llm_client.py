@@ -1,13 +1,80 @@
 import ollama
+import hashlib
+import json
 import logging
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parse_json(content):
+    """
+    Parses LLM output as JSON (orjson when available), salvaging the common
+    "prose around the JSON" failure mode by retrying on the outermost {...}
+    span. Returns None if nothing parseable is found.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        return loads(content)
+    except Exception:
+        start, end = content.find('{'), content.rfind('}')
+        if 0 <= start < end:
+            try:
+                return loads(content[start:end + 1])
+            except Exception:
+                pass
+        return None
 
 # Set up logging for LLM interactions
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+CACHE_PATH = os.path.expanduser("~/.gitsight/llm_cache.db")
+
+# One client shared by every LocalLLM instance, so repeated instantiations
+# (e.g. per Streamlit rerun) reuse the same keep-alive connection to Ollama
+_CLIENT = ollama.Client(host='http://localhost:11434')
+
+class LLMCache:
+    """
+    On-disk cache of LLM responses keyed by a prompt hash, so re-running an
+    analysis (common while debugging) skips the multi-second Ollama decodes.
+    """
+    def __init__(self, path=CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # check_same_thread=False: the analyzer calls the LLM from worker threads
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+        )
+        self.conn.commit()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, value, time.time())
+            )
+            self.conn.commit()
+
 class LocalLLM:
     def __init__(self, model_name="llama3"):
         self.model = model_name
-        self.client = ollama.Client(host='http://localhost:11434')
+        self.client = _CLIENT
+        try:
+            self.cache = LLMCache()
+        except Exception as e:
+            logging.warning(f"LLM cache unavailable: {e}")
+            self.cache = None
 
     def is_available(self):
         try:
@@ -47,15 +114,79 @@ class LocalLLM:
         - weaknesses (list of strings)
         """
         try:
+            key = hashlib.sha256(f"{self.model}|readme|{readme_content[:2000]}".encode()).hexdigest()
+            if self.cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return _parse_json(cached)
+
             response = self.client.chat(model=self.model, messages=[
                 {'role': 'user', 'content': prompt}
-            ], format='json')
-            import json
-            return json.loads(response['message']['content'])
+            ], format='json', options={'temperature': 0})
+            result = _parse_json(response['message']['content'])
+            if result is not None and self.cache:
+                self.cache.set(key, json.dumps(result))
+            return result
         except Exception as e:
             logging.error(f"LLM README analysis failed: {e}")
             return None
 
+    def analyze_readmes_batch(self, readmes):
+        """
+        Analyzes several READMEs in one chat call instead of one round-trip
+        each — first-token latency dominates on local models, so batching
+        amortizes it across repos. Takes (name, content) pairs and returns
+        {name: {score, strengths, weaknesses}} for every README the model
+        (or the cache) produced a usable answer for.
+        """
+        results = {}
+        misses = []
+        for name, content in readmes:
+            excerpt = content[:2000]
+            # Same key as analyze_readme, so single and batched calls share the cache
+            key = hashlib.sha256(f"{self.model}|readme|{excerpt}".encode()).hexdigest()
+            if self.cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    item = _parse_json(cached)
+                    if item is not None:
+                        results[name] = item
+                        continue
+            misses.append((name, excerpt, key))
+
+        if not misses:
+            return results
+
+        sections = "\n\n".join(f"README[name={name}]:\n{excerpt}" for name, excerpt, _ in misses)
+        prompt = f"""
+        You are a Senior Technical Recruiter. Analyze each of the following README contents from GitHub repositories.
+        Evaluate each on: Clarity, Completeness, and Technical Depth.
+
+        Output a single JSON object keyed by README name, where each value is an object with:
+        - score (0-100)
+        - strengths (list of strings)
+        - weaknesses (list of strings)
+
+        {sections}
+        """
+        try:
+            response = self.client.chat(model=self.model, messages=[
+                {'role': 'user', 'content': prompt}
+            ], format='json', options={'temperature': 0})
+            parsed = _parse_json(response['message']['content'])
+        except Exception as e:
+            logging.error(f"LLM batched README analysis failed: {e}")
+            return results
+
+        if isinstance(parsed, dict):
+            for name, excerpt, key in misses:
+                item = parsed.get(name)
+                if isinstance(item, dict):
+                    results[name] = item
+                    if self.cache:
+                        self.cache.set(key, json.dumps(item))
+        return results
+
     def generate_profile_summary(self, profile_data, readiness_score):
         """
         Generates a high-level executive summary of the developer based on the data.
@@ -74,10 +205,21 @@ class LocalLLM:
         Focus on their strengths, potential fit for roles, and critical areas for improvement. Be professional and direct.
         """
         try:
+            # The prompt already contains the exact profile subset interpolated
+            # above, so hashing it keys the cache on everything that matters
+            key = hashlib.sha256(f"{self.model}|summary|{prompt}".encode()).hexdigest()
+            if self.cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+
             response = self.client.chat(model=self.model, messages=[
                 {'role': 'user', 'content': prompt}
             ])
-            return response['message']['content']
+            content = response['message']['content']
+            if self.cache:
+                self.cache.set(key, content)
+            return content
         except Exception as e:
             logging.error(f"LLM Summary generation failed: {e}")
             return "Summary generation failed due to LLM error."
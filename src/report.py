@@ -1,14 +1,35 @@
 import json
 import os
+from dataclasses import asdict, is_dataclass
+from heapq import nlargest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    # score_breakdown is a slots dataclass in memory; dict-ify it here at
+    # the serialization boundary (orjson handles dataclasses natively)
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
 
 class ReportGenerator:
     def __init__(self, data):
         self.data = data
 
+    def to_json_bytes(self):
+        """Serializes the full structured report to JSON bytes in memory."""
+        # orjson's C writer is ~5-10x faster than stdlib pretty-printing
+        if orjson is not None:
+            return orjson.dumps(self.data, default=str, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.data, indent=2, default=_json_default).encode("utf-8")
+
     def generate_json(self, output_path="report.json"):
         """Saves the full structured report to a JSON file."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2, default=str)
+        with open(output_path, "wb") as f:
+            f.write(self.to_json_bytes())
         return output_path
 
     def generate_markdown(self, output_path="SUMMARY.md"):
@@ -19,11 +40,12 @@ class ReportGenerator:
         roles = self.data.get("role_scores", {}).get("role_scores", {})
         repos = profile.get("repositories", [])
         
-        # Sort repos by score
-        sorted_repos = sorted(repos, key=lambda x: x.get("composite_score", 0), reverse=True)
-        top_repos = sorted_repos[:3]
+        # Top repos by score — O(n) heap selection, no full sort
+        top_repos = nlargest(3, repos, key=lambda x: x.get("composite_score", 0))
 
-        md = f"""# 📊 GitHub Profile Analysis — @{username}
+        # Collect fragments and join once at the end — O(n) instead of
+        # quadratic str += inside the loops
+        parts = [f"""# 📊 GitHub Profile Analysis — @{username}
 
 **Hiring Readiness Score: {readiness.get('score', 0)}/100 — {readiness.get('tier', 'Unknown')}**
 
@@ -32,56 +54,58 @@ class ReportGenerator:
 {readiness.get('tier_label', '')}
 
 ### 🏅 Repository Highlights
-"""
+"""]
         for r in top_repos:
-            md += f"- **[{r['repo_name']}]({r['repo_url']})**: {r.get('composite_score', 0)}/100 ({r.get('rating', '')}) - {r.get('description', 'No description')} \n"
+            parts.append(f"- **[{r['repo_name']}]({r['repo_url']})**: {r.get('composite_score', 0)}/100 ({r.get('rating', '')}) - {r.get('description', 'No description')} \n")
 
-        md += f"""
+        parts.append(f"""
 ### 💼 Role Fit
 - **ML Engineer**: {roles.get('ml_engineer', {}).get('score', 0)}/100 — {roles.get('ml_engineer', {}).get('fit_label', '')}
 - **Backend Engineer**: {roles.get('backend_engineer', {}).get('score', 0)}/100 — {roles.get('backend_engineer', {}).get('fit_label', '')}
 - **SRE**: {roles.get('sre', {}).get('score', 0)}/100 — {roles.get('sre', {}).get('fit_label', '')}
 
 ### ✅ What's Working
-"""
-        # Aggregate strengths
-        all_strengths = []
-        for r in repos:
-            all_strengths.extend(r.get("strengths", []))
-        
-        # Dedupe and pick top 5
-        unique_strengths = list(set(all_strengths))[:5]
+""")
+        # Use the aggregation precomputed by the analyzer; re-loop only for
+        # older report data that lacks it
+        unique_strengths = profile.get("top_strengths")
+        if unique_strengths is None:
+            all_strengths = []
+            for r in repos:
+                all_strengths.extend(r.get("strengths", []))
+            unique_strengths = list(dict.fromkeys(all_strengths))[:5]
         if not unique_strengths:
-            md += "- No major strengths detected automatically.\n"
+            parts.append("- No major strengths detected automatically.\n")
         for s in unique_strengths:
-            md += f"- {s}\n"
+            parts.append(f"- {s}\n")
 
-        md += """
+        parts.append("""
 ### ⚠️ What Needs Improvement
-"""
-        # Aggregate weaknesses
-        all_weaknesses = []
-        for r in repos:
-            all_weaknesses.extend(r.get("weaknesses", []))
-        
-        unique_weaknesses = list(set(all_weaknesses))[:5]
+""")
+        unique_weaknesses = profile.get("top_weaknesses")
+        if unique_weaknesses is None:
+            all_weaknesses = []
+            for r in repos:
+                all_weaknesses.extend(r.get("weaknesses", []))
+            unique_weaknesses = list(dict.fromkeys(all_weaknesses))[:5]
         if not unique_weaknesses:
-             md += "- No major weaknesses detected automatically.\n"
+             parts.append("- No major weaknesses detected automatically.\n")
         for w in unique_weaknesses:
-            md += f"- {w}\n"
+            parts.append(f"- {w}\n")
 
-        md += """
+        parts.append("""
 ### 🚀 Top Actions to Increase Hiring Readiness
-"""
+""")
         # Generate generic actions if score is low
         if readiness.get('score', 0) < 50:
-            md += "1. Add unit tests (pytest/jest) to your top projects.\n"
-            md += "2. Improving README documentation with installation instructions.\n"
-            md += "3. Setup a CI pipeline (GitHub Actions) for your main repo.\n"
+            parts.append("1. Add unit tests (pytest/jest) to your top projects.\n")
+            parts.append("2. Improving README documentation with installation instructions.\n")
+            parts.append("3. Setup a CI pipeline (GitHub Actions) for your main repo.\n")
         else:
-             md += "1. Continue maintaining high code quality.\n"
+             parts.append("1. Continue maintaining high code quality.\n")
 
+        md = "".join(parts)
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(md)
-        
+
         return output_path
@@ -1,3 +1,153 @@
+import hashlib
+import heapq
+import json
+import re
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numpy's per-call overhead loses to plain Python on small inputs; only
+# switch to the vectorized reduction past this many repos
+_NUMPY_MIN_REPOS = 64
+
+try:
+    from . import _kernels
+    _USE_KERNELS = _kernels.NUMBA_AVAILABLE
+except ImportError:
+    _USE_KERNELS = False
+
+ML_KEYWORDS = frozenset({"model", "train", "dataset", "jupyter", "pandas", "numpy", "sklearn", "tensorflow", "pytorch"})
+BE_KEYWORDS = frozenset({"api", "server", "database", "sql", "rest", "graphql", "docker", "auth"})
+SRE_KEYWORDS = frozenset({"kubernetes", "docker", "terraform", "ansible", "cloud", "aws", "gcp", "azure", "monitor", "prometheus"})
+BE_LANGS = frozenset({"Python", "Go", "Java", "JavaScript", "TypeScript", "Rust"})
+
+def _build_automaton(keywords):
+    """Builds an Aho-Corasick automaton, or None when the lib is missing."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+def _build_pattern(keywords):
+    """Compiles the keywords into a single alternation regex."""
+    return re.compile("|".join(map(re.escape, sorted(keywords))))
+
+# Built once at import; each description is then scanned in a single DFA
+# pass instead of one substring search per keyword. The compiled regex
+# alternation is the zero-dependency fallback: still one sre pass over
+# the text for all keywords
+ML_AC = _build_automaton(ML_KEYWORDS)
+BE_AC = _build_automaton(BE_KEYWORDS)
+SRE_AC = _build_automaton(SRE_KEYWORDS)
+ML_RE = _build_pattern(ML_KEYWORDS)
+BE_RE = _build_pattern(BE_KEYWORDS)
+SRE_RE = _build_pattern(SRE_KEYWORDS)
+
+def _matches_any(automaton, pattern, text):
+    """True if any keyword occurs in text."""
+    if not text:
+        return False
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return pattern.search(text) is not None
+
+# Both scoring functions are pure in the repo fields below, and the UI calls
+# them repeatedly with identical data; memoize on a stable digest with a small
+# LRU so re-renders are dict hits
+_MEMO_MAX = 32
+_readiness_memo = OrderedDict()
+_role_fit_memo = OrderedDict()
+
+def _profile_digest(repos):
+    """Digest over exactly the repo fields the scoring functions read."""
+    payload = json.dumps(
+        [
+            (r.get("composite_score"), r.get("language"), r.get("description"),
+             bool(r.get("critical_flags")),
+             r["score_breakdown"].testing_ci,
+             r["score_breakdown"].deployability,
+             r["score_breakdown"].code_structure)
+            for r in repos
+        ],
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+def _memo_get(cache, key):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _memo_put(cache, key, value):
+    cache[key] = value
+    while len(cache) > _MEMO_MAX:
+        cache.popitem(last=False)
+
+class _ScoringView:
+    """
+    Struct-of-arrays view over the repo dicts: one extraction pass feeds
+    both scoring functions (and the numpy/Numba kernels), instead of each
+    re-walking the dicts. Cached by profile digest alongside the result
+    memos, so tab switches in the UI reuse the same arrays.
+    """
+    __slots__ = ("scores", "tci", "dep", "cs", "crit", "languages",
+                 "desc_lower", "critical_count")
+
+_view_memo = OrderedDict()
+
+def _build_view(repos):
+    scores = []
+    tci = []
+    dep = []
+    cs = []
+    crit = []
+    languages = []
+    desc_lower = []
+    for r in repos:
+        sb = r["score_breakdown"]
+        scores.append(r["composite_score"])
+        tci.append(sb.testing_ci)
+        dep.append(sb.deployability)
+        cs.append(sb.code_structure)
+        crit.append(1 if r.get("critical_flags") else 0)
+        languages.append(r["language"])
+        desc = r["description"]
+        desc_lower.append(desc.lower() if desc else "")
+
+    view = _ScoringView()
+    view.critical_count = sum(crit)
+    view.languages = languages
+    view.desc_lower = desc_lower
+    if np is not None:
+        view.scores = np.asarray(scores, dtype=np.float32)
+        view.tci = np.asarray(tci, dtype=np.float32)
+        view.dep = np.asarray(dep, dtype=np.float32)
+        view.cs = np.asarray(cs, dtype=np.float32)
+        view.crit = np.asarray(crit, dtype=np.uint8)
+    else:
+        view.scores, view.tci, view.dep, view.cs, view.crit = scores, tci, dep, cs, crit
+    return view
+
+def _view_for(repos, memo_key):
+    view = _memo_get(_view_memo, memo_key)
+    if view is None:
+        view = _build_view(repos)
+        _memo_put(_view_memo, memo_key, view)
+    return view
 
 def compute_hiring_readiness(profile_data):
     """
@@ -20,31 +170,61 @@ def compute_hiring_readiness(profile_data):
             "tier_label": "Foundational gaps; focus on fundamentals first"
         }
 
-    # Extract scores
-    repo_scores = [r["composite_score"] for r in repos]
-    avg_repo_score = sum(repo_scores) / len(repo_scores) if repo_scores else 0
-    
-    # Best 3 repos
-    best_3 = sorted(repo_scores, reverse=True)[:3]
-    best_3_repos_avg = sum(best_3) / len(best_3) if best_3 else 0
+    memo_key = _profile_digest(repos)
+    cached = _memo_get(_readiness_memo, memo_key)
+    if cached is not None:
+        return cached
+
+    n_repos = len(repos)
+    view = _view_for(repos, memo_key)
+    langs = {lang for lang in view.languages if lang}
+    critical_count = view.critical_count
+    if _USE_KERNELS:
+        # Numeric reduction in the Numba kernel over the view's SoA arrays
+        (avg_repo_score, best_3_repos_avg, testing_ci_count,
+         deployability_count) = _kernels.readiness_reduce(view.scores, view.tci, view.dep)
+    elif np is not None and n_repos >= _NUMPY_MIN_REPOS:
+        # Large portfolios (orgs, bots): the reductions run vectorized in C.
+        # np.partition finds the top 3 in O(n) without a full sort
+        avg_repo_score = float(view.scores.mean())
+        k = min(3, n_repos)
+        best_3_repos_avg = float(np.partition(view.scores, -k)[-k:].mean())
+        testing_ci_count = int((view.tci > 0).sum())
+        deployability_count = int((view.dep > 0).sum())
+    else:
+        # Single pass over the view: running sum, a size-3 min-heap for the
+        # best repos, and counters — instead of one list comp / sort /
+        # generator per component
+        total_score = 0
+        best_3 = []
+        testing_ci_count = 0
+        deployability_count = 0
+        for score, tci, dep in zip(view.scores, view.tci, view.dep):
+            total_score += score
+            if len(best_3) < 3:
+                heapq.heappush(best_3, score)
+            else:
+                heapq.heappushpop(best_3, score)
+            if tci > 0: testing_ci_count += 1
+            if dep > 0: deployability_count += 1
+
+        avg_repo_score = total_score / n_repos
+
+        # Best 3 repos
+        best_3_repos_avg = sum(best_3) / len(best_3)
 
     # Portfolio Diversity (check languages and topics)
-    langs = load_languages(repos)
     portfolio_diversity = min(100, len(langs) * 20) # Simple heuristic: 5 languages = 100%
 
     # Testing & CI Presence (% of repos with tests/CI > 0)
-    testing_ci_presence = sum(1 for r in repos if r["score_breakdown"]["testing_ci"] > 0) / len(repos) * 100
+    testing_ci_presence = testing_ci_count / n_repos * 100
 
     # Deployability Presence
-    deployability_presence = sum(1 for r in repos if r["score_breakdown"]["deployability"] > 0) / len(repos) * 100
+    deployability_presence = deployability_count / n_repos * 100
 
     # Security Baseline (absence of critical issues)
-    # Start at 100, deduct for critical flags
-    security_baseline = 100 
-    for r in repos:
-        if r.get("critical_flags"): # If ANY repo has critical flags
-             security_baseline -= 20
-    security_baseline = max(0, security_baseline)
+    # Start at 100, deduct 20 per repo with critical flags
+    security_baseline = max(0, 100 - 20 * critical_count)
 
     # Compute Final Score
     score = (
@@ -57,20 +237,17 @@ def compute_hiring_readiness(profile_data):
     )
     
     final_score = int(score)
-    
-    # Determine Tier
-    tier = "Unknown"
-    if final_score >= 85: tier = "🏆 Hire-Ready"
-    elif final_score >= 70: tier = "✅ Competitive"
-    elif final_score >= 55: tier = "📈 Developing"
-    elif final_score >= 40: tier = "⚠️ Early Stage"
-    else: tier = "🔴 Not Ready"
-
-    return {
+
+    # Determine Tier (bisect over the sorted cutoffs, no branch ladder)
+    tier = _TIER_NAMES[bisect_right(_TIER_CUTOFFS, final_score)]
+
+    result = {
         "score": final_score,
         "tier": tier,
         "tier_label": get_tier_label(tier)
     }
+    _memo_put(_readiness_memo, memo_key, result)
+    return result
 
 def compute_role_fit(profile_data):
     """
@@ -89,58 +266,72 @@ def compute_role_fit(profile_data):
     repos = profile_data.get("repositories", [])
     if not repos: return {"role_scores": roles}
 
-    # ML Fit
-    ml_keywords = ["model", "train", "dataset", "jupyter", "pandas", "numpy", "sklearn", "tensorflow", "pytorch"]
+    memo_key = _profile_digest(repos)
+    cached = _memo_get(_role_fit_memo, memo_key)
+    if cached is not None:
+        return cached
+
+    # One fused pass over the shared view: descriptions were lowered once
+    # at view build time and each is scanned once per role automaton
+    view = _view_for(repos, memo_key)
     ml_score = 0
-    for r in repos:
-        if r["language"] == "Jupyter Notebook" or r["language"] == "Python":
+    be_score = 0
+    sre_score = 0
+    for language, desc_lower, struct, deploy in zip(
+            view.languages, view.desc_lower, view.cs, view.dep):
+        # ML Fit
+        if language == "Jupyter Notebook" or language == "Python":
             ml_score += 10
-        if any(k in r["description"].lower() for k in ml_keywords if r["description"]):
+        if _matches_any(ML_AC, ML_RE, desc_lower):
             ml_score += 15
-    roles["ml_engineer"]["score"] = min(100, ml_score)
-    roles["ml_engineer"]["fit_label"] = get_fit_label(roles["ml_engineer"]["score"])
 
-    # Backend Fit
-    be_keywords = ["api", "server", "database", "sql", "rest", "graphql", "docker", "auth"]
-    be_score = 0
-    for r in repos:
-        if r["language"] in ["Python", "Go", "Java", "JavaScript", "TypeScript", "Rust"]:
+        # Backend Fit
+        if language in BE_LANGS:
             be_score += 10
-        if any(k in r["description"].lower() for k in be_keywords if r["description"]):
+        if _matches_any(BE_AC, BE_RE, desc_lower):
             be_score += 15
-        be_score += r["score_breakdown"]["code_structure"] / 10 # Bonus for structure
-    roles["backend_engineer"]["score"] = min(100, int(be_score))
-    roles["backend_engineer"]["fit_label"] = get_fit_label(roles["backend_engineer"]["score"])
+        be_score += struct / 10 # Bonus for structure
 
-    # SRE Fit
-    sre_keywords = ["kubernetes", "docker", "terraform", "ansible", "cloud", "aws", "gcp", "azure", "monitor", "prometheus"]
-    sre_score = 0
-    for r in repos:
-         if any(k in r["description"].lower() for k in sre_keywords if r["description"]):
+        # SRE Fit
+        if _matches_any(SRE_AC, SRE_RE, desc_lower):
             sre_score += 20
-         sre_score += r["score_breakdown"]["deployability"] / 2 # Strong weight on deployability
+        sre_score += deploy / 2 # Strong weight on deployability
+
+    roles["ml_engineer"]["score"] = min(100, ml_score)
+    roles["ml_engineer"]["fit_label"] = get_fit_label(roles["ml_engineer"]["score"])
+    roles["backend_engineer"]["score"] = min(100, int(be_score))
+    roles["backend_engineer"]["fit_label"] = get_fit_label(roles["backend_engineer"]["score"])
     roles["sre"]["score"] = min(100, int(sre_score))
     roles["sre"]["fit_label"] = get_fit_label(roles["sre"]["score"])
-    
-    return {"role_scores": roles}
 
+    result = {"role_scores": roles}
+    _memo_put(_role_fit_memo, memo_key, result)
+    return result
+
+# score >= cutoff[i] lands in _TIER_NAMES[i + 1] (bisect_right, >= semantics)
+_TIER_CUTOFFS = (40, 55, 70, 85)
+_TIER_NAMES = ("🔴 Not Ready", "⚠️ Early Stage", "📈 Developing", "✅ Competitive", "🏆 Hire-Ready")
+
+# score > cutoff[i] lands in _FIT_NAMES[i + 1] (bisect_left, > semantics)
+_FIT_CUTOFFS = (50, 80)
+_FIT_NAMES = ("Low Fit", "Moderate Fit", "High Fit")
+
+_TIER_LABELS = {
+    "🏆 Hire-Ready": "Strong candidate; portfolio speaks for itself",
+    "✅ Competitive": "Solid candidate; minor gaps to address",
+    "📈 Developing": "Promising; needs focused improvement in 2-3 areas",
+    "⚠️ Early Stage": "Real potential; portfolio needs significant work",
+    "🔴 Not Ready": "Foundational gaps; focus on fundamentals first"
+}
+
+@lru_cache(maxsize=128)
 def get_fit_label(score):
-    if score > 80: return "High Fit"
-    if score > 50: return "Moderate Fit"
-    return "Low Fit"
+    return _FIT_NAMES[bisect_left(_FIT_CUTOFFS, score)]
 
 def get_tier_label(tier):
-    labels = {
-        "🏆 Hire-Ready": "Strong candidate; portfolio speaks for itself",
-        "✅ Competitive": "Solid candidate; minor gaps to address",
-        "📈 Developing": "Promising; needs focused improvement in 2-3 areas",
-        "⚠️ Early Stage": "Real potential; portfolio needs significant work",
-        "🔴 Not Ready": "Foundational gaps; focus on fundamentals first"
-    }
-    return labels.get(tier, "")
+    return _TIER_LABELS.get(tier, "")
 
 def load_languages(repos):
-    s = set()
-    for r in repos:
-        if r["language"]: s.add(r["language"])
-    return list(s)
+    # Callers only need membership/len, so return the set directly — no
+    # set→list copy, and the comprehension filters in C
+    return {r["language"] for r in repos if r["language"]}